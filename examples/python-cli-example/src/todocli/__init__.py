@@ -4,6 +4,6 @@ __version__ = "1.0.0"
 
 from .cli import cli
 from .models import Priority, Todo
-from .storage import TodoStorage
+from .storage import SqliteTodoStorage, TodoStorage
 
-__all__ = ["cli", "Todo", "Priority", "TodoStorage", "__version__"]
+__all__ = ["cli", "Todo", "Priority", "TodoStorage", "SqliteTodoStorage", "__version__"]
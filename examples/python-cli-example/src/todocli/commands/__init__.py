@@ -0,0 +1,5 @@
+"""Todo CLI commands, one module per command.
+
+Each module exposes its Click command as ``cmd`` and is imported by
+``todocli.cli`` only when that command is invoked.
+"""
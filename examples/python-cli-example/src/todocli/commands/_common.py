@@ -0,0 +1,47 @@
+"""Helpers shared by the Todo CLI commands."""
+
+from typing import TYPE_CHECKING
+
+import click
+
+from ..models import Priority
+from ..storage import AnyTodoStorage, open_storage
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+# Shared --priority option type. Matching is case-insensitive, and Click
+# returns the canonical lowercase value, so commands need no further lowering.
+PRIORITY_CHOICE = click.Choice([p.value for p in Priority], case_sensitive=False)
+
+# Rich color used to render each priority level
+PRIORITY_COLORS = {"high": "red", "medium": "yellow", "low": "green"}
+
+# Rich is slow to import, so it is loaded on first output rather than at startup
+_console: "Console | None" = None
+
+
+def get_console() -> "Console":
+    """Return the shared Rich console, creating it on first use."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+
+        _console = Console()
+    return _console
+
+
+def get_storage(ctx: click.Context) -> AnyTodoStorage:
+    """Return the storage for this invocation, opening it on first use.
+
+    The backend is picked by TODOCLI_BACKEND (see open_storage). A storage
+    already present in ``ctx.obj`` (for example one passed in by the caller)
+    is reused and left open, so all commands in one invocation share it.
+    """
+    obj = ctx.ensure_object(dict)
+    if "storage" not in obj:
+        obj["storage"] = open_storage()
+        # Only close what we opened; a caller's storage is theirs to close
+        ctx.call_on_close(obj["storage"].close)
+    storage: AnyTodoStorage = obj["storage"]
+    return storage
@@ -0,0 +1,57 @@
+"""Command for adding todo items."""
+
+from datetime import datetime
+from typing import Optional
+
+import click
+
+from ..models import Todo
+from ._common import PRIORITY_CHOICE, get_console, get_storage
+
+
+@click.command("add")
+@click.argument("title")
+@click.option(
+    "-d", "--description", default="", help="Task description"
+)
+@click.option(
+    "-p",
+    "--priority",
+    type=PRIORITY_CHOICE,
+    default="medium",
+    help="Task priority",
+)
+@click.option("-c", "--category", default="", help="Task category")
+@click.option("--due", help="Due date (YYYY-MM-DD)")
+@click.pass_context
+def cmd(
+    ctx: click.Context,
+    title: str,
+    description: str,
+    priority: str,
+    category: str,
+    due: Optional[str],
+) -> None:
+    """Add a new todo item."""
+    storage = get_storage(ctx)
+
+    # Validate due date; the parsed value is handed to Todo so it isn't parsed twice
+    due_dt = None
+    if due:
+        try:
+            due_dt = datetime.fromisoformat(due)
+        except ValueError:
+            get_console().print("[red]Invalid date format. Use YYYY-MM-DD[/red]")
+            return
+
+    todo = Todo(
+        title=title,
+        description=description,
+        priority=priority,
+        category=category,
+        due_date=due,
+        _due_dt=due_dt,
+    )
+
+    storage.add(todo)
+    get_console().print(f"[green]✓[/green] Added: {title}")
@@ -0,0 +1,15 @@
+"""Command for clearing completed todos."""
+
+import click
+
+from ._common import get_console, get_storage
+
+
+@click.command("clear")
+@click.confirmation_option(prompt="Are you sure you want to clear all completed todos?")
+@click.pass_context
+def cmd(ctx: click.Context) -> None:
+    """Clear all completed todos."""
+    storage = get_storage(ctx)
+    count = storage.clear_completed()
+    get_console().print(f"[green]✓[/green] Cleared {count} completed todo(s)")
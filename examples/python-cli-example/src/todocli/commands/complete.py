@@ -0,0 +1,35 @@
+"""Command for marking todos as completed."""
+
+from datetime import datetime
+
+import click
+
+from ._common import get_console, get_storage
+
+
+@click.command("complete")
+@click.argument("todo_id")
+@click.pass_context
+def cmd(ctx: click.Context, todo_id: str) -> None:
+    """Mark a todo as completed."""
+    storage = get_storage(ctx)
+
+    # Find by partial ID match
+    matching = storage.find_by_prefix(todo_id)
+
+    if not matching:
+        get_console().print(f"[red]Todo not found: {todo_id}[/red]")
+        return
+
+    if len(matching) > 1:
+        get_console().print(f"[yellow]Multiple matches found. Be more specific.[/yellow]")
+        return
+
+    todo = matching[0]
+    todo.completed = True
+    todo.completed_at = datetime.now().isoformat()
+
+    if storage.update(todo):
+        get_console().print(f"[green]✓[/green] Completed: {todo.title}")
+    else:
+        get_console().print(f"[red]Failed to update todo[/red]")
@@ -0,0 +1,32 @@
+"""Command for deleting todo items."""
+
+import click
+
+from ._common import get_console, get_storage
+
+
+@click.command("delete")
+@click.argument("todo_id")
+@click.confirmation_option(prompt="Are you sure you want to delete this todo?")
+@click.pass_context
+def cmd(ctx: click.Context, todo_id: str) -> None:
+    """Delete a todo item."""
+    storage = get_storage(ctx)
+
+    # Find by partial ID match
+    matching = storage.find_by_prefix(todo_id)
+
+    if not matching:
+        get_console().print(f"[red]Todo not found: {todo_id}[/red]")
+        return
+
+    if len(matching) > 1:
+        get_console().print(f"[yellow]Multiple matches found. Be more specific.[/yellow]")
+        return
+
+    todo = matching[0]
+
+    if storage.delete(todo.id):
+        get_console().print(f"[green]✓[/green] Deleted: {todo.title}")
+    else:
+        get_console().print(f"[red]Failed to delete todo[/red]")
@@ -0,0 +1,92 @@
+"""Command for listing todo items."""
+
+from datetime import datetime
+from operator import attrgetter
+from typing import Optional
+
+import click
+
+from ._common import PRIORITY_CHOICE, PRIORITY_COLORS, get_console, get_storage
+
+# Active first, then by priority (high -> medium -> low), then oldest first
+_SORT_KEY = attrgetter("completed", "priority_rank", "created_at")
+
+
+@click.command("list")
+@click.option("-a", "--all", "show_all", is_flag=True, help="Show completed tasks")
+@click.option("-c", "--category", help="Filter by category")
+@click.option(
+    "-p",
+    "--priority",
+    type=PRIORITY_CHOICE,
+    help="Filter by priority",
+)
+@click.pass_context
+def cmd(
+    ctx: click.Context, show_all: bool, category: Optional[str], priority: Optional[str]
+) -> None:
+    """List all todo items."""
+    storage = get_storage(ctx)
+    todos = storage.load()
+
+    # Apply all filters in a single pass
+    category_lower = category.lower() if category else None
+    todos = [
+        t
+        for t in todos
+        if (show_all or not t.completed)
+        and (category_lower is None or t.category.lower() == category_lower)
+        and (priority is None or t.priority == priority)
+    ]
+
+    if not todos:
+        get_console().print("[yellow]No tasks found[/yellow]")
+        return
+
+    # Sort by priority (high -> medium -> low) then by created date
+    todos.sort(key=_SORT_KEY)
+
+    from rich.table import Table
+
+    # Create table
+    now = datetime.now()
+    table = Table(show_header=True, header_style="bold magenta")
+    table.add_column("ID", style="dim", width=8)
+    table.add_column("✓", width=3)
+    table.add_column("Title")
+    table.add_column("Priority", width=8)
+    table.add_column("Category", width=12)
+    table.add_column("Due Date", width=12)
+
+    for todo in todos:
+        # Color coding
+        priority_color = PRIORITY_COLORS.get(todo.priority, "white")
+
+        # Status icon
+        status = "[green]✓[/green]" if todo.completed else "[ ]"
+
+        # Title styling
+        title = f"[dim]{todo.title}[/dim]" if todo.completed else todo.title
+
+        # Due date with overdue indicator
+        due_date = ""
+        if todo.due_date:
+            due_date = todo.due_date
+            if todo.is_overdue_at(now):
+                due_date = f"[red]{due_date} ⚠[/red]"
+
+        table.add_row(
+            todo.id[:8],
+            status,
+            title,
+            f"[{priority_color}]{todo.priority}[/{priority_color}]",
+            todo.category or "-",
+            due_date or "-",
+        )
+
+    get_console().print(table)
+    get_console().print(
+        f"\n[dim]Total: {len(todos)} task(s) | "
+        f"Active: {sum(1 for t in todos if not t.completed)} | "
+        f"Completed: {sum(1 for t in todos if t.completed)}[/dim]"
+    )
@@ -0,0 +1,62 @@
+"""Command for showing todo details."""
+
+import click
+
+from ._common import PRIORITY_COLORS, get_console, get_storage
+
+
+@click.command("show")
+@click.argument("todo_id")
+@click.pass_context
+def cmd(ctx: click.Context, todo_id: str) -> None:
+    """Show detailed information about a todo."""
+    storage = get_storage(ctx)
+
+    # Find by partial ID match
+    matching = storage.find_by_prefix(todo_id)
+
+    if not matching:
+        get_console().print(f"[red]Todo not found: {todo_id}[/red]")
+        return
+
+    if len(matching) > 1:
+        get_console().print(f"[yellow]Multiple matches found. Be more specific.[/yellow]")
+        return
+
+    todo = matching[0]
+
+    from rich.table import Table
+
+    # Create details table
+    table = Table(show_header=False, box=None, padding=(0, 2))
+    table.add_column("Field", style="bold cyan")
+    table.add_column("Value")
+
+    status = "✓ Completed" if todo.completed else "⏸ Active"
+    status_color = "green" if todo.completed else "yellow"
+
+    table.add_row("ID", todo.id)
+    table.add_row("Title", todo.title)
+    table.add_row("Status", f"[{status_color}]{status}[/{status_color}]")
+
+    if todo.description:
+        table.add_row("Description", todo.description)
+
+    priority_color = PRIORITY_COLORS.get(todo.priority, "white")
+    table.add_row("Priority", f"[{priority_color}]{todo.priority}[/{priority_color}]")
+
+    if todo.category:
+        table.add_row("Category", todo.category)
+
+    if todo.due_date:
+        due_text = todo.due_date
+        if todo.is_overdue:
+            due_text = f"[red]{due_text} (Overdue!)[/red]"
+        table.add_row("Due Date", due_text)
+
+    table.add_row("Created", todo.created_at[:19].replace("T", " "))
+
+    if todo.completed_at:
+        table.add_row("Completed", todo.completed_at[:19].replace("T", " "))
+
+    get_console().print(table)
@@ -0,0 +1,67 @@
+"""Command for showing todo statistics."""
+
+from datetime import datetime
+
+import click
+
+from ._common import get_console, get_storage
+
+
+@click.command("stats")
+@click.pass_context
+def cmd(ctx: click.Context) -> None:
+    """Show todo statistics."""
+    storage = get_storage(ctx)
+    todos = storage.load()
+
+    # Tally everything in a single pass over the todos
+    counts = {"completed": 0, "high": 0, "medium": 0, "low": 0, "overdue": 0}
+    categories: dict[str, int] = {}
+    now = datetime.now()
+    for todo in todos:
+        if todo.completed:
+            counts["completed"] += 1
+            continue
+
+        if todo.priority in counts:
+            counts[todo.priority] += 1
+        if todo.is_overdue_at(now):
+            counts["overdue"] += 1
+        if todo.category:
+            categories[todo.category] = categories.get(todo.category, 0) + 1
+
+    total = len(todos)
+    completed = counts["completed"]
+    active = total - completed
+    high, medium, low = counts["high"], counts["medium"], counts["low"]
+    overdue = counts["overdue"]
+
+    # Completion rate
+    completion_rate = (completed / total * 100) if total > 0 else 0
+
+    from rich.table import Table
+
+    # Display stats
+    table = Table(show_header=True, header_style="bold cyan")
+    table.add_column("Metric", style="bold")
+    table.add_column("Value", justify="right")
+
+    table.add_row("Total Tasks", str(total))
+    table.add_row("Active Tasks", f"[yellow]{active}[/yellow]")
+    table.add_row("Completed Tasks", f"[green]{completed}[/green]")
+    table.add_row("Completion Rate", f"{completion_rate:.1f}%")
+    table.add_row("", "")
+    table.add_row("High Priority", f"[red]{high}[/red]")
+    table.add_row("Medium Priority", f"[yellow]{medium}[/yellow]")
+    table.add_row("Low Priority", f"[green]{low}[/green]")
+
+    if overdue > 0:
+        table.add_row("", "")
+        table.add_row("Overdue Tasks", f"[red bold]{overdue} ⚠[/red bold]")
+
+    get_console().print(table)
+
+    if categories:
+        get_console().print("\n[bold]Active Tasks by Category:[/bold]")
+        for cat, count in sorted(categories.items(), key=lambda x: x[1], reverse=True):
+            get_console().print(f"  • {cat}: {count}")
@@ -0,0 +1,33 @@
+"""Command for reopening completed todos."""
+
+import click
+
+from ._common import get_console, get_storage
+
+
+@click.command("uncomplete")
+@click.argument("todo_id")
+@click.pass_context
+def cmd(ctx: click.Context, todo_id: str) -> None:
+    """Mark a completed todo as incomplete."""
+    storage = get_storage(ctx)
+
+    # Find by partial ID match
+    matching = storage.find_by_prefix(todo_id)
+
+    if not matching:
+        get_console().print(f"[red]Todo not found: {todo_id}[/red]")
+        return
+
+    if len(matching) > 1:
+        get_console().print(f"[yellow]Multiple matches found. Be more specific.[/yellow]")
+        return
+
+    todo = matching[0]
+    todo.completed = False
+    todo.completed_at = None
+
+    if storage.update(todo):
+        get_console().print(f"[green]✓[/green] Reopened: {todo.title}")
+    else:
+        get_console().print(f"[red]Failed to update todo[/red]")
@@ -15,7 +15,11 @@ class Priority(str, Enum):
     HIGH = "high"
 
 
-@dataclass
+# Sort rank for each priority level (high -> medium -> low)
+_PRIORITY_ORDER = {"high": 0, "medium": 1, "low": 2}
+
+
+@dataclass(slots=True)
 class Todo:
     """Todo item with all attributes."""
 
@@ -23,20 +27,35 @@ class Todo:
     title: str = ""
     description: str = ""
     completed: bool = False
-    priority: Priority = Priority.MEDIUM
+    priority: str = Priority.MEDIUM.value  # Stored as a plain Priority value
     category: str = ""
     due_date: Optional[str] = None
     created_at: str = field(default_factory=lambda: datetime.now().isoformat())
     completed_at: Optional[str] = None
+    # Parsed due_date and the due_date string it was parsed from. Callers that
+    # already parsed due_date may pass the result in
+    _due_dt: datetime | None = field(default=None, kw_only=True, repr=False, compare=False)
+    _due_src: str | None = field(default=None, init=False, repr=False, compare=False)
+    # Sort rank of priority and the priority it was computed from
+    _prio_rank: int = field(default=1, init=False, repr=False, compare=False)
+    _prio_src: str | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Normalize priority and precompute its sort rank."""
+        self._sync_priority()
+        if self._due_dt is not None:
+            self._set_due_dt(self._due_dt)
 
     def to_dict(self) -> dict:
         """Convert todo to dictionary."""
+        if self.priority is not self._prio_src:
+            self._sync_priority()
         return {
             "id": self.id,
             "title": self.title,
             "description": self.description,
             "completed": self.completed,
-            "priority": self.priority.value if isinstance(self.priority, Priority) else self.priority,
+            "priority": self.priority,
             "category": self.category,
             "due_date": self.due_date,
             "created_at": self.created_at,
@@ -46,24 +65,60 @@ class Todo:
     @classmethod
     def from_dict(cls, data: dict) -> "Todo":
         """Create todo from dictionary."""
-        data_copy = data.copy()
-        if "priority" in data_copy and isinstance(data_copy["priority"], str):
-            data_copy["priority"] = Priority(data_copy["priority"])
-        return cls(**data_copy)
+        # The uuid4()/now() default factories only run for keys missing from
+        # data, so stored todos (which carry every field) don't pay for them
+        return cls(**data)
+
+    @property
+    def priority_rank(self) -> int:
+        """Sort rank of the priority: 0 for high, 1 for medium, 2 for low."""
+        if self.priority is not self._prio_src:
+            self._sync_priority()
+        return self._prio_rank
+
+    @property
+    def priority_enum(self) -> Priority:
+        """Priority as a Priority enum member."""
+        return Priority(self.priority)
 
     @property
     def is_overdue(self) -> bool:
         """Check if todo is overdue."""
-        if self.completed or not self.due_date:
+        return self.is_overdue_at(datetime.now())
+
+    def is_overdue_at(self, now: datetime) -> bool:
+        """Check if todo is overdue relative to the given time."""
+        if self.completed:
             return False
+        if self.due_date != self._due_src:
+            self._parse_due_date()
+        return self._due_dt is not None and self._due_dt < now
+
+    def _parse_due_date(self) -> None:
+        """Parse due_date, so it's only parsed again after it changes."""
         try:
-            due = datetime.fromisoformat(self.due_date)
-            return due < datetime.now()
+            due = datetime.fromisoformat(self.due_date) if self.due_date else None
         except (ValueError, TypeError):
-            return False
+            due = None
+        self._set_due_dt(due)
+
+    def _set_due_dt(self, due: datetime | None) -> None:
+        """Remember the parsed value of the current due_date."""
+        if due is not None and due.tzinfo is not None:
+            # Compare against naive datetime.now(): convert to naive local time
+            due = due.astimezone().replace(tzinfo=None)
+        self._due_dt = due
+        self._due_src = self.due_date
+
+    def _sync_priority(self) -> None:
+        """Validate priority and rank it, so this is only redone after it changes."""
+        # Accepts a Priority or its string value; validates and stores the string
+        self.priority = Priority(self.priority).value
+        self._prio_rank = _PRIORITY_ORDER[self.priority]
+        self._prio_src = self.priority
 
 
-@dataclass
+@dataclass(slots=True)
 class Config:
     """Application configuration."""
 
@@ -1,84 +1,326 @@
 """Storage management for todos."""
 
+import hashlib
 import json
+import os
+from collections.abc import Iterable
 from pathlib import Path
-from typing import List
+from typing import TYPE_CHECKING, Any
 
 from .models import Config, Todo
 
+if TYPE_CHECKING:
+    import sqlite3
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None  # type: ignore[assignment]
+
+# Length of the short ID shown in listings and typically typed by users
+ID_PREFIX_LEN = 8
+
+
+def _dumps(data: Any) -> bytes:
+    """Serialize data to indented JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
+def _digest(raw: bytes) -> bytes:
+    """Return a short fingerprint of serialized file contents."""
+    return hashlib.blake2b(raw, digest_size=8).digest()
+
+
+def _loads(raw: bytes) -> Any:
+    """Parse JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 
 class TodoStorage:
-    """Manage todo storage in JSON file."""
+    """Manage todo storage in JSON file.
+
+    The raw JSON records are kept in memory and Todo objects are built from
+    them on demand, so commands that touch a single todo don't have to
+    construct one for every record in the file.
+    """
 
     def __init__(self, data_file: str = "~/.todocli/todos.json"):
         """Initialize storage with data file path."""
         self.data_file = Path(data_file).expanduser()
         self.data_file.parent.mkdir(parents=True, exist_ok=True)
+        self._records: list[dict[str, Any]] | None = None
+        self._cache: list[Todo] | None = None
+        self._by_prefix: dict[str, list[dict[str, Any]]] = {}
+        self._by_id: dict[str, int] = {}
+        self._last_hash: bytes | None = None
+
+    def close(self) -> None:
+        """Release resources; the JSON backend holds none between writes."""
+
+    def load(self) -> list[Todo]:
+        """Load all todos, building them only on first access."""
+        if self._cache is None:
+            self._cache = self._build(self._raw())
+        return self._cache
+
+    def find_by_prefix(self, prefix: str) -> list[Todo]:
+        """Find todos whose ID starts with the given (partial) ID."""
+        candidates = self._raw()
+        if len(prefix) >= ID_PREFIX_LEN:
+            candidates = self._by_prefix.get(prefix[:ID_PREFIX_LEN], [])
+        # Only matching records are turned into Todo objects
+        return self._build(r for r in candidates if r["id"].startswith(prefix))
+
+    def _build(self, records: Iterable[dict[str, Any]]) -> list[Todo]:
+        """Build Todo objects, treating an invalid record as a corrupted file."""
+        try:
+            return [Todo.from_dict(record) for record in records]
+        except (KeyError, ValueError):
+            self._backup_corrupted()
+            self._set_records([])
+            self._cache = []
+            return []
+
+    def _raw(self) -> list[dict[str, Any]]:
+        """Return the stored records, reading the JSON file only on first access."""
+        if self._records is None:
+            records = self._read()
+            self._set_records(records)
+            return records
+        return self._records
+
+    def _set_records(self, records: list[dict[str, Any]]) -> None:
+        """Remember the stored records and index them by short and full ID."""
+        self._records = records
+        self._by_prefix = {}
+        self._by_id = {}
+        for i, record in enumerate(records):
+            self._by_prefix.setdefault(record["id"][:ID_PREFIX_LEN], []).append(record)
+            self._by_id[record["id"]] = i
 
-    def load(self) -> List[Todo]:
-        """Load todos from JSON file."""
+    def _read(self) -> list[dict[str, Any]]:
+        """Read raw todo records from JSON file."""
         if not self.data_file.exists():
             return []
 
         try:
-            with open(self.data_file, "r") as f:
-                data = json.load(f)
-                return [Todo.from_dict(item) for item in data]
-        except (json.JSONDecodeError, KeyError, ValueError):
-            # Backup corrupted file
-            backup = self.data_file.with_suffix(".json.bak")
-            if self.data_file.exists():
-                self.data_file.rename(backup)
+            raw = self.data_file.read_bytes()
+            records = _loads(raw)
+            if not isinstance(records, list) or not all(
+                isinstance(record, dict) and "id" in record for record in records
+            ):
+                raise ValueError("Unexpected todo file layout")
+        except ValueError:
+            # Also covers json/orjson decode errors, which subclass ValueError
+            self._backup_corrupted()
             return []
 
-    def save(self, todos: List[Todo]) -> None:
+        self._last_hash = _digest(raw)
+        return records
+
+    def _backup_corrupted(self) -> None:
+        """Move a corrupted data file aside so it can be recovered by hand."""
+        backup = self.data_file.with_suffix(".json.bak")
+        if self.data_file.exists():
+            self.data_file.rename(backup)
+
+    def _write(self, records: list[dict[str, Any]]) -> None:
+        """Write records to JSON file, skipping the write if nothing changed."""
+        raw = _dumps(records)
+        digest = _digest(raw)
+        if digest != self._last_hash or not self.data_file.exists():
+            # Write to a temp file, flush it to disk and swap it in, so neither
+            # a crash nor a power loss can leave a truncated data file behind
+            tmp_file = self.data_file.with_suffix(".json.tmp")
+            try:
+                with open(tmp_file, "wb") as f:
+                    f.write(raw)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_file, self.data_file)
+            except BaseException:
+                tmp_file.unlink(missing_ok=True)
+                raise
+            self._last_hash = digest
+        self._set_records(records)
+        self._cache = None
+
+    def save(self, todos: list[Todo]) -> None:
         """Save todos to JSON file."""
-        self.data_file.parent.mkdir(parents=True, exist_ok=True)
+        self._write([todo.to_dict() for todo in todos])
+        self._cache = todos
 
-        with open(self.data_file, "w") as f:
-            json.dump([todo.to_dict() for todo in todos], f, indent=2)
+    def add(self, todo: Todo) -> None:
+        """Add a new todo."""
+        records = self._raw()
+        records.append(todo.to_dict())
+        self._write(records)
+
+    def get(self, todo_id: str) -> Todo | None:
+        """Get a todo by ID."""
+        records = self._raw()
+        i = self._by_id.get(todo_id)
+        if i is None:
+            return None
+        todos = self._build([records[i]])
+        return todos[0] if todos else None
+
+    def update(self, todo: Todo) -> bool:
+        """Update an existing todo."""
+        records = self._raw()
+        i = self._by_id.get(todo.id)
+        if i is None:
+            return False
+        records[i] = todo.to_dict()
+        self._write(records)
+        return True
+
+    def delete(self, todo_id: str) -> bool:
+        """Delete a todo by ID."""
+        records = self._raw()
+        i = self._by_id.get(todo_id)
+        if i is None:
+            return False
+        # _write() re-indexes, so positions after i stay correct
+        records.pop(i)
+        self._write(records)
+        return True
+
+    def clear_completed(self) -> int:
+        """Delete all completed todos."""
+        records = self._raw()
+        remaining = [record for record in records if not record.get("completed")]
+        self._write(remaining)
+        return len(records) - len(remaining)
+
+
+class SqliteTodoStorage:
+    """Manage todo storage in a SQLite database.
+
+    Each mutation touches a single row instead of rewriting the whole file,
+    which keeps large todo lists fast. Select it with TODOCLI_BACKEND=sqlite.
+    """
+
+    _COLUMNS = (
+        "id",
+        "title",
+        "description",
+        "completed",
+        "priority",
+        "category",
+        "due_date",
+        "created_at",
+        "completed_at",
+    )
+
+    def __init__(self, db_file: str = "~/.todocli/todos.db"):
+        """Initialize storage with database file path."""
+        self.db_file = Path(db_file).expanduser()
+        self.db_file.parent.mkdir(parents=True, exist_ok=True)
+        # Imported here so the default JSON backend doesn't pay for sqlite3 at startup
+        import sqlite3
+
+        self._conn = sqlite3.connect(self.db_file)
+        self._conn.row_factory = sqlite3.Row
+        with self._conn:
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS todos (
+                    id TEXT PRIMARY KEY,
+                    title TEXT NOT NULL,
+                    description TEXT NOT NULL,
+                    completed INTEGER NOT NULL,
+                    priority TEXT NOT NULL,
+                    category TEXT NOT NULL,
+                    due_date TEXT,
+                    created_at TEXT NOT NULL,
+                    completed_at TEXT
+                )
+                """
+            )
+
+    @staticmethod
+    def _record(row: "sqlite3.Row") -> dict[str, Any]:
+        """Convert a database row to a todo record."""
+        record = dict(row)
+        record["completed"] = bool(record["completed"])
+        return record
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
+
+    def load(self) -> list[Todo]:
+        """Load all todos in insertion order."""
+        rows = self._conn.execute("SELECT * FROM todos ORDER BY rowid")
+        return [Todo.from_dict(self._record(row)) for row in rows]
+
+    def find_by_prefix(self, prefix: str) -> list[Todo]:
+        """Find todos whose ID starts with the given (partial) ID."""
+        # A range scan on the primary key; unlike LIKE it can use the index
+        # and treats "%" and "_" in the prefix literally
+        rows = self._conn.execute(
+            "SELECT * FROM todos WHERE id >= ? AND id < ? ORDER BY rowid",
+            (prefix, prefix + "\U0010ffff"),
+        )
+        return [Todo.from_dict(self._record(row)) for row in rows]
+
+    def save(self, todos: list[Todo]) -> None:
+        """Replace all stored todos."""
+        with self._conn:
+            self._conn.execute("DELETE FROM todos")
+            self._conn.executemany(self._insert_sql(), [todo.to_dict() for todo in todos])
 
     def add(self, todo: Todo) -> None:
         """Add a new todo."""
-        todos = self.load()
-        todos.append(todo)
-        self.save(todos)
+        with self._conn:
+            self._conn.execute(self._insert_sql(), todo.to_dict())
 
     def get(self, todo_id: str) -> Todo | None:
         """Get a todo by ID."""
-        todos = self.load()
-        for todo in todos:
-            if todo.id == todo_id:
-                return todo
-        return None
+        row = self._conn.execute("SELECT * FROM todos WHERE id = ?", (todo_id,)).fetchone()
+        return Todo.from_dict(self._record(row)) if row else None
 
     def update(self, todo: Todo) -> bool:
         """Update an existing todo."""
-        todos = self.load()
-        for i, t in enumerate(todos):
-            if t.id == todo.id:
-                todos[i] = todo
-                self.save(todos)
-                return True
-        return False
+        assignments = ", ".join(f"{col} = :{col}" for col in self._COLUMNS[1:])
+        with self._conn:
+            cursor = self._conn.execute(
+                f"UPDATE todos SET {assignments} WHERE id = :id", todo.to_dict()
+            )
+        return cursor.rowcount > 0
 
     def delete(self, todo_id: str) -> bool:
         """Delete a todo by ID."""
-        todos = self.load()
-        for i, todo in enumerate(todos):
-            if todo.id == todo_id:
-                todos.pop(i)
-                self.save(todos)
-                return True
-        return False
+        with self._conn:
+            cursor = self._conn.execute("DELETE FROM todos WHERE id = ?", (todo_id,))
+        return cursor.rowcount > 0
 
     def clear_completed(self) -> int:
         """Delete all completed todos."""
-        todos = self.load()
-        initial_count = len(todos)
-        todos = [todo for todo in todos if not todo.completed]
-        self.save(todos)
-        return initial_count - len(todos)
+        with self._conn:
+            cursor = self._conn.execute("DELETE FROM todos WHERE completed = 1")
+        return cursor.rowcount
+
+    def _insert_sql(self) -> str:
+        """Build the INSERT statement for a todo record."""
+        columns = ", ".join(self._COLUMNS)
+        values = ", ".join(f":{col}" for col in self._COLUMNS)
+        return f"INSERT INTO todos ({columns}) VALUES ({values})"
+
+
+AnyTodoStorage = TodoStorage | SqliteTodoStorage
+
+
+def open_storage() -> AnyTodoStorage:
+    """Create the todo storage backend selected by TODOCLI_BACKEND."""
+    if os.environ.get("TODOCLI_BACKEND", "json").lower() == "sqlite":
+        return SqliteTodoStorage()
+    return TodoStorage()
 
 
 class ConfigStorage:
@@ -95,15 +337,11 @@ class ConfigStorage:
             return Config()
 
         try:
-            with open(self.config_file, "r") as f:
-                data = json.load(f)
-                return Config.from_dict(data)
+            data = _loads(self.config_file.read_bytes())
+            return Config.from_dict(data)
         except (json.JSONDecodeError, KeyError, ValueError):
             return Config()
 
     def save(self, config: Config) -> None:
         """Save config to JSON file."""
-        self.config_file.parent.mkdir(parents=True, exist_ok=True)
-
-        with open(self.config_file, "w") as f:
-            json.dump(config.to_dict(), f, indent=2)
+        self.config_file.write_bytes(_dumps(config.to_dict()))
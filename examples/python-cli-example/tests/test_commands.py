@@ -0,0 +1,275 @@
+"""Tests for todocli commands."""
+
+import json
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+import click
+import pytest
+from click.testing import CliRunner, Result
+
+from todocli.cli import _COMMANDS, cli
+from todocli.models import Priority, Todo
+from todocli.storage import SqliteTodoStorage, TodoStorage
+
+
+@pytest.fixture(params=["json", "sqlite"])
+def env(tmp_path: Path, request: pytest.FixtureRequest) -> dict[str, str]:
+    """Point HOME at a temporary directory and select each storage backend in turn."""
+    return {"HOME": str(tmp_path), "TODOCLI_BACKEND": str(request.param)}
+
+
+def _modules_after_help(*args: str) -> set[str]:
+    """Run --help in a fresh interpreter and return the modules it imported."""
+    code = (
+        "import sys\n"
+        "from todocli.cli import cli\n"
+        f"try:\n    cli({list(args) + ['--help']!r})\n"
+        "except SystemExit:\n    pass\n"
+        "print(*sys.modules, file=sys.stderr)"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    return set(result.stderr.split())
+
+
+def _invoke(runner: CliRunner, env: dict[str, str], *args: str) -> Result:
+    """Invoke the CLI with the test environment."""
+    result = runner.invoke(cli, list(args), env=env)
+    assert result.exception is None, result.output
+    return result
+
+
+def _seed(env: dict[str, str], *todos: Todo) -> None:
+    """Store todos in the data file the CLI will read."""
+    data_dir = Path(env["HOME"]) / ".todocli"
+    if env["TODOCLI_BACKEND"] == "sqlite":
+        storage = SqliteTodoStorage(str(data_dir / "todos.db"))
+        storage.save(list(todos))
+        storage.close()
+    else:
+        TodoStorage(str(data_dir / "todos.json")).save(list(todos))
+
+
+def _seed_ids(env: dict[str, str]) -> None:
+    """Store todos whose IDs share and differ in their short-ID prefix."""
+    _seed(
+        env,
+        Todo(id="aaaaaaaa-0001", title="First"),
+        Todo(id="aaaaaaaa-0002", title="Second"),
+        Todo(id="bbbbbbbb-0001", title="Third"),
+    )
+
+
+def test_complete_unique_prefix(runner: CliRunner, env: dict[str, str]) -> None:
+    """Test completing a todo by a unique partial ID."""
+    _seed_ids(env)
+    assert "Completed: Third" in _invoke(runner, env, "complete", "bbb").output
+    assert "Completed" in _invoke(runner, env, "show", "bbbbbbbb-0001").output
+
+
+def test_complete_ambiguous_prefix(runner: CliRunner, env: dict[str, str]) -> None:
+    """Test a partial ID shared by several todos is rejected."""
+    _seed_ids(env)
+    result = _invoke(runner, env, "complete", "aaaaaaaa")
+    assert "Multiple matches found" in result.output
+
+
+def test_complete_not_found(runner: CliRunner, env: dict[str, str]) -> None:
+    """Test completing an unknown ID."""
+    _seed_ids(env)
+    result = _invoke(runner, env, "complete", "cccc")
+    assert "Todo not found: cccc" in result.output
+
+
+def test_delete_then_complete_later_todo(runner: CliRunner, env: dict[str, str]) -> None:
+    """Test a todo stored after a deleted one can still be completed."""
+    _seed_ids(env)
+    assert "Deleted: First" in _invoke(runner, env, "delete", "aaaaaaaa-0001", "--yes").output
+    assert "Completed: Third" in _invoke(runner, env, "complete", "bbbbbbbb").output
+
+    output = _invoke(runner, env, "list", "--all").output
+    assert "First" not in output and "Second" in output and "Third" in output
+
+
+def _stat(output: str, metric: str) -> str:
+    """Return the value shown for a metric in the stats table."""
+    match = re.search(rf"{metric}\s*│\s*(\S+)", output)
+    assert match, output
+    return match.group(1)
+
+
+def test_stats_counts(runner: CliRunner, env: dict[str, str]) -> None:
+    """Test stats tallies active todos by priority and category."""
+    _seed(
+        env,
+        Todo(title="a", priority=Priority.HIGH, category="work"),
+        Todo(title="b", priority=Priority.HIGH, category="home"),
+        Todo(title="c", priority=Priority.LOW, category="work"),
+        Todo(title="d", priority=Priority.MEDIUM, category="work", completed=True),
+    )
+    output = _invoke(runner, env, "stats").output
+
+    assert _stat(output, "Total Tasks") == "4"
+    assert _stat(output, "Active Tasks") == "3"
+    assert _stat(output, "Completed Tasks") == "1"
+    assert _stat(output, "High Priority") == "2"
+    assert _stat(output, "Medium Priority") == "0"
+    assert _stat(output, "Low Priority") == "1"
+    assert "Overdue Tasks" not in output
+    assert "work: 2" in output and "home: 1" in output
+
+
+def test_stats_counts_offset_aware_due_date(runner: CliRunner, env: dict[str, str]) -> None:
+    """Test an offset-aware due date is counted as overdue."""
+    _invoke(runner, env, "add", "Deadline", "--due", "2020-01-01T00:00+00:00")
+    assert _stat(_invoke(runner, env, "stats").output, "Overdue Tasks") == "1"
+
+
+@pytest.mark.parametrize("args", [(), ("add",)])
+def test_help_does_not_import_rich(args: tuple[str, ...]) -> None:
+    """Test --help works without importing Rich."""
+    assert "rich" not in _modules_after_help(*args)
+
+
+def test_help_imports_only_invoked_command() -> None:
+    """Test --help doesn't import command modules, and a subcommand imports only itself."""
+    assert not any(m.startswith("todocli.commands.") for m in _modules_after_help())
+
+    loaded = {m for m in _modules_after_help("add") if m.startswith("todocli.commands.")}
+    assert loaded == {"todocli.commands.add", "todocli.commands._common"}
+
+
+@pytest.mark.parametrize("name", sorted(_COMMANDS))
+def test_command_summaries_match_docstrings(name: str) -> None:
+    """Test the help summaries listed without importing commands stay in sync."""
+    command = cli.get_command(click.Context(cli), name)
+    assert command is not None
+    assert _COMMANDS[name] == command.get_short_help_str()
+
+
+@pytest.mark.parametrize("args", [("--help",), ("add", "--help"), ("--version",)])
+def test_help_does_not_open_storage(
+    runner: CliRunner, env: dict[str, str], args: tuple[str, ...]
+) -> None:
+    """Test --help and --version don't create the data directory or database."""
+    _invoke(runner, env, *args)
+    assert not (Path(env["HOME"]) / ".todocli").exists()
+
+
+@pytest.mark.parametrize("storage_class", [TodoStorage, SqliteTodoStorage])
+def test_uses_storage_passed_in_obj(
+    runner: CliRunner, tmp_path: Path, storage_class: type[TodoStorage | SqliteTodoStorage]
+) -> None:
+    """Test a storage supplied by the caller is used, and left open, by commands."""
+    storage = storage_class(str(tmp_path / "custom" / "todos"))
+    result = runner.invoke(
+        cli, ["add", "Custom"], obj={"storage": storage}, env={"HOME": str(tmp_path)}
+    )
+
+    assert result.exception is None, result.output
+    assert [t.title for t in storage.load()] == ["Custom"]
+    assert not (tmp_path / ".todocli").exists()
+    storage.close()
+
+
+def test_opened_storage_is_closed(
+    runner: CliRunner, env: dict[str, str], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test the storage opened for an invocation is closed when it finishes."""
+    closed: list[object] = []
+    for storage_class in (TodoStorage, SqliteTodoStorage):
+        monkeypatch.setattr(storage_class, "close", lambda self: closed.append(self))
+
+    _invoke(runner, env, "list")
+    assert len(closed) == 1
+
+
+def _order(output: str, *titles: str) -> list[str]:
+    """Return the given titles in the order they appear in the output."""
+    assert all(title in output for title in titles), output
+    return sorted(titles, key=output.index)
+
+
+def test_list_sorts_by_status_priority_and_age(runner: CliRunner, env: dict[str, str]) -> None:
+    """Test list shows active todos first, by priority, oldest first."""
+    _seed(
+        env,
+        Todo(title="Done", priority=Priority.HIGH, completed=True, created_at="2024-01-01"),
+        Todo(title="Low old", priority=Priority.LOW, created_at="2024-01-01"),
+        Todo(title="High new", priority=Priority.HIGH, created_at="2024-01-03"),
+        Todo(title="High old", priority=Priority.HIGH, created_at="2024-01-02"),
+        Todo(title="Medium", priority=Priority.MEDIUM, created_at="2024-01-01"),
+    )
+    output = _invoke(runner, env, "list", "--all").output
+
+    titles = ("Done", "Low old", "High new", "High old", "Medium")
+    assert _order(output, *titles) == ["High old", "High new", "Medium", "Low old", "Done"]
+    assert "Total: 5 task(s) | Active: 4 | Completed: 1" in output
+
+
+@pytest.mark.parametrize(
+    ("args", "expected"),
+    [
+        ((), ["Work high", "Home low"]),
+        (("--all",), ["Work high", "Home low", "Work done"]),
+        (("-c", "WORK"), ["Work high"]),
+        (("-a", "-c", "work"), ["Work high", "Work done"]),
+        (("-p", "low"), ["Home low"]),
+        (("-a", "-c", "work", "-p", "high"), ["Work high", "Work done"]),
+    ],
+)
+def test_list_filters(
+    runner: CliRunner, env: dict[str, str], args: tuple[str, ...], expected: list[str]
+) -> None:
+    """Test list combines the completed, category and priority filters."""
+    _seed(
+        env,
+        Todo(title="Work high", priority=Priority.HIGH, category="Work"),
+        Todo(title="Home low", priority=Priority.LOW, category="home"),
+        Todo(title="Work done", priority=Priority.HIGH, category="work", completed=True),
+    )
+    output = _invoke(runner, env, "list", *args).output
+
+    titles = ("Work high", "Home low", "Work done")
+    assert [title for title in titles if title in output] == expected
+
+
+def test_list_no_matches(runner: CliRunner, env: dict[str, str]) -> None:
+    """Test list reports when filters leave nothing to show."""
+    _seed(env, Todo(title="Work high", priority=Priority.HIGH, category="work"))
+    assert "No tasks found" in _invoke(runner, env, "list", "-c", "home").output
+
+
+@pytest.mark.parametrize("value", ["HIGH", "High", "high"])
+def test_priority_option_is_case_insensitive(
+    runner: CliRunner, env: dict[str, str], value: str
+) -> None:
+    """Test --priority accepts any case and stores the canonical value."""
+    _invoke(runner, env, "add", "Urgent", "-p", value)
+    _invoke(runner, env, "add", "Later", "-p", "low")
+
+    output = _invoke(runner, env, "list", "-p", value).output
+    assert "Urgent" in output and "Later" not in output
+    assert _stat(_invoke(runner, env, "stats").output, "High Priority") == "1"
+
+
+def test_priority_option_rejects_unknown_value(runner: CliRunner, env: dict[str, str]) -> None:
+    """Test --priority rejects values outside the Priority enum."""
+    result = runner.invoke(cli, ["add", "Urgent", "-p", "urgent"], env=env)
+    assert result.exit_code == 2
+    assert "Invalid value for '-p' / '--priority'" in result.output
+
+
+def test_corrupt_record_does_not_crash(runner: CliRunner, tmp_path: Path) -> None:
+    """Test a JSON record with an unknown priority is backed up instead of crashing."""
+    record = {**Todo(id="aaaaaaaa-0001", title="First").to_dict(), "priority": "urgent"}
+    data_file = tmp_path / ".todocli" / "todos.json"
+    data_file.parent.mkdir()
+    data_file.write_text(json.dumps([record]))
+
+    result = _invoke(runner, {"HOME": str(tmp_path)}, "complete", "aaaaaaaa")
+    assert "Todo not found" in result.output
+    assert data_file.with_suffix(".json.bak").exists()
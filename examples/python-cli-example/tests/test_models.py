@@ -0,0 +1,101 @@
+"""Tests for todo models."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from todocli.models import Config, Priority, Todo
+
+NOW = datetime(2024, 6, 1, 12, 0)
+
+
+@pytest.mark.parametrize(
+    ("due_date", "overdue"),
+    [
+        (None, False),
+        ("2024-05-31", True),
+        ("2024-06-02", False),
+        ("2024-05-31T00:00:00+00:00", True),
+        ("not a date", False),
+    ],
+)
+def test_is_overdue_at(due_date: str | None, overdue: bool) -> None:
+    """Test overdue checks for missing, past, future, offset-aware and invalid dates."""
+    assert Todo(due_date=due_date).is_overdue_at(NOW) is overdue
+
+
+def test_is_overdue_ignores_completed() -> None:
+    """Test completed todos are never overdue."""
+    assert not Todo(due_date="2024-05-31", completed=True).is_overdue_at(NOW)
+
+
+def test_is_overdue_follows_due_date_changes() -> None:
+    """Test reassigning due_date after an overdue check takes effect."""
+    todo = Todo(due_date="2024-05-31")
+    assert todo.is_overdue_at(NOW)
+
+    todo.due_date = None
+    assert not todo.is_overdue_at(NOW)
+
+    todo.due_date = (NOW - timedelta(hours=1)).isoformat()
+    assert todo.is_overdue_at(NOW)
+
+
+def test_is_overdue_uses_passed_due_datetime(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test a parsed due date passed to Todo is used instead of parsing again."""
+    todo = Todo(due_date="2024-05-31", _due_dt=datetime(2024, 5, 31))
+    monkeypatch.setattr(Todo, "_parse_due_date", lambda self: pytest.fail("parsed again"))
+    assert todo.is_overdue_at(NOW)
+
+    monkeypatch.undo()
+    todo.due_date = None
+    assert not todo.is_overdue_at(NOW)
+
+
+@pytest.mark.parametrize("model", [Todo, Config])
+def test_models_use_slots(model: type) -> None:
+    """Test instances carry no per-object __dict__."""
+    instance = model()
+    assert not hasattr(instance, "__dict__")
+    with pytest.raises(AttributeError):
+        instance.unknown = 1
+
+
+def test_priority_rank_follows_priority_changes() -> None:
+    """Test reassigning priority updates the sort rank."""
+    todo = Todo(priority=Priority.LOW)
+    assert todo.priority_rank == 2
+
+    todo.priority = Priority.HIGH
+    assert todo.priority_rank == 0
+
+
+def test_invalid_priority_assignment_is_rejected() -> None:
+    """Test an invalid priority assigned after construction is still validated."""
+    todo = Todo()
+    todo.priority = "urgent"
+
+    with pytest.raises(ValueError):
+        todo.priority_rank
+    with pytest.raises(ValueError):
+        todo.to_dict()
+
+
+def test_priority_is_stored_as_its_value() -> None:
+    """Test a Priority member is stored, and serialized, as its plain string."""
+    todo = Todo(priority=Priority.HIGH)
+    assert type(todo.priority) is str and todo.priority == "high"
+    assert todo.priority_enum is Priority.HIGH
+
+    todo.priority = Priority.LOW
+    assert type(todo.to_dict()["priority"]) is str
+    assert todo.to_dict()["priority"] == "low"
+
+
+def test_from_dict_keeps_stored_id_and_created_at() -> None:
+    """Test a stored todo round-trips without new default values being generated."""
+    todo = Todo(title="First", created_at="2024-01-01T09:00:00")
+    restored = Todo.from_dict(todo.to_dict())
+
+    assert restored == todo
+    assert (restored.id, restored.created_at) == (todo.id, "2024-01-01T09:00:00")
@@ -0,0 +1,243 @@
+"""Tests for todo storage."""
+
+import json
+import os
+from collections.abc import Callable, Iterator
+from pathlib import Path
+
+import pytest
+
+from todocli import storage as storage_module
+from todocli.models import Config, Priority, Todo
+from todocli.storage import AnyTodoStorage, ConfigStorage, SqliteTodoStorage, TodoStorage
+
+
+def _open(backend: str, directory: Path) -> AnyTodoStorage:
+    """Open the given storage backend on a data file in directory."""
+    if backend == "sqlite":
+        return SqliteTodoStorage(str(directory / "todos.db"))
+    return TodoStorage(str(directory / "todos.json"))
+
+
+@pytest.fixture(params=["json", "sqlite"])
+def backend(request: pytest.FixtureRequest) -> str:
+    """Run a test against each storage backend."""
+    return str(request.param)
+
+
+@pytest.fixture
+def reopen(backend: str, tmp_path: Path) -> Iterator[Callable[[], AnyTodoStorage]]:
+    """Provide a factory opening fresh storages on the same data file."""
+    opened: list[AnyTodoStorage] = []
+
+    def open_() -> AnyTodoStorage:
+        opened.append(_open(backend, tmp_path))
+        return opened[-1]
+
+    yield open_
+    for storage in opened:
+        storage.close()
+
+
+@pytest.fixture
+def storage(reopen: Callable[[], AnyTodoStorage]) -> AnyTodoStorage:
+    """Provide an empty storage backed by a temporary file."""
+    return reopen()
+
+
+def test_load_reads_file_once(tmp_path: Path) -> None:
+    """Test repeated loads reuse the todos read on first access."""
+    TodoStorage(str(tmp_path / "todos.json")).save([Todo(title="First")])
+
+    storage = TodoStorage(str(tmp_path / "todos.json"))
+    todos = storage.load()
+    assert storage.load() is todos
+
+
+def test_roundtrip(storage: AnyTodoStorage, reopen: Callable[[], AnyTodoStorage]) -> None:
+    """Test every field survives being stored and read back."""
+    todo = Todo(
+        title="Café ☕",
+        description="Beans",
+        completed=True,
+        priority=Priority.HIGH,
+        category="home",
+        due_date="2024-06-01",
+        completed_at="2024-05-31T08:00:00",
+    )
+    storage.add(todo)
+
+    assert reopen().load() == [todo]
+    assert reopen().get(todo.id) == todo
+
+
+def test_update_persists_changes(
+    storage: AnyTodoStorage, reopen: Callable[[], AnyTodoStorage]
+) -> None:
+    """Test an updated todo is written back and other records are kept."""
+    storage.save([Todo(id="aaaaaaaa-0001", title="First"), Todo(title="Second")])
+    todo = storage.find_by_prefix("aaaaaaaa-0001")[0]
+    todo.completed = True
+
+    assert storage.update(todo)
+    reloaded = reopen().load()
+    assert [(t.title, t.completed) for t in reloaded] == [("First", True), ("Second", False)]
+
+
+def test_update_missing(storage: AnyTodoStorage) -> None:
+    """Test updating a todo that isn't stored reports failure."""
+    _seed(storage)
+    assert not storage.update(Todo(id="cccccccc-0001", title="Nope"))
+    assert [t.title for t in storage.load()] == ["First", "Second", "Third"]
+
+
+def test_delete_then_update_later_record(
+    storage: AnyTodoStorage, reopen: Callable[[], AnyTodoStorage]
+) -> None:
+    """Test records after a deleted one are still found by ID."""
+    _seed(storage)
+    assert storage.delete("aaaaaaaa-0001")
+    assert storage.get("aaaaaaaa-0001") is None
+
+    todo = storage.get("bbbbbbbb-0001")
+    assert todo is not None and todo.title == "Third"
+    todo.completed = True
+    assert storage.update(todo)
+
+    reloaded = reopen().load()
+    assert [(t.title, t.completed) for t in reloaded] == [("Second", False), ("Third", True)]
+
+
+def test_delete_missing(storage: AnyTodoStorage) -> None:
+    """Test deleting an unknown ID leaves the stored todos alone."""
+    _seed(storage)
+    assert not storage.delete("cccccccc-0001")
+    assert len(storage.load()) == 3
+
+
+def test_clear_completed(storage: AnyTodoStorage, reopen: Callable[[], AnyTodoStorage]) -> None:
+    """Test completed todos are removed and the rest are kept."""
+    storage.save([Todo(title="Done", completed=True), Todo(title="Open")])
+
+    assert storage.clear_completed() == 1
+    assert [t.title for t in reopen().load()] == ["Open"]
+
+
+@pytest.mark.parametrize(
+    "contents",
+    [b"{not json", b'{"id": "x"}', b'[{"title": "no id"}]'],
+    ids=["invalid-json", "not-a-list", "missing-id"],
+)
+def test_corrupt_file_is_backed_up(tmp_path: Path, contents: bytes) -> None:
+    """Test an unreadable data file is moved aside and treated as empty."""
+    (tmp_path / "todos.json").write_bytes(contents)
+
+    assert TodoStorage(str(tmp_path / "todos.json")).load() == []
+    assert (tmp_path / "todos.json.bak").read_bytes() == contents
+
+
+def test_invalid_record_found_by_prefix_is_backed_up(tmp_path: Path) -> None:
+    """Test a record that fails to build is handled like a corrupted file."""
+    record = {**Todo(id="aaaaaaaa-0001", title="First").to_dict(), "priority": "urgent"}
+    (tmp_path / "todos.json").write_text(json.dumps([record]))
+
+    assert TodoStorage(str(tmp_path / "todos.json")).find_by_prefix("aaaaaaaa") == []
+    assert (tmp_path / "todos.json.bak").exists()
+
+
+def test_constructor_creates_data_directory(tmp_path: Path) -> None:
+    """Test missing parent directories are created up front, not on save."""
+    storage = TodoStorage(str(tmp_path / "nested" / "dir" / "todos.json"))
+    assert (tmp_path / "nested" / "dir").is_dir()
+
+    storage.save([Todo(title="First")])
+    assert (tmp_path / "nested" / "dir" / "todos.json").exists()
+
+
+def _seed(storage: AnyTodoStorage) -> None:
+    """Store todos whose IDs share and differ in their short-ID prefix."""
+    storage.save(
+        [
+            Todo(id="aaaaaaaa-0001", title="First"),
+            Todo(id="aaaaaaaa-0002", title="Second"),
+            Todo(id="bbbbbbbb-0001", title="Third"),
+        ]
+    )
+
+
+@pytest.mark.parametrize("prefix", ["b", "bbbbbbbb", "bbbbbbbb-0001"])
+def test_find_by_prefix_unique(storage: AnyTodoStorage, prefix: str) -> None:
+    """Test short, index-length and full prefixes that match one todo."""
+    _seed(storage)
+    assert [t.title for t in storage.find_by_prefix(prefix)] == ["Third"]
+
+
+@pytest.mark.parametrize("prefix", ["aaa", "aaaaaaaa", "aaaaaaaa-000"])
+def test_find_by_prefix_ambiguous(storage: AnyTodoStorage, prefix: str) -> None:
+    """Test prefixes shared by several todos."""
+    _seed(storage)
+    assert [t.title for t in storage.find_by_prefix(prefix)] == ["First", "Second"]
+
+
+@pytest.mark.parametrize("prefix", ["c", "cccccccc", "aaaaaaaa-0003", "%", "a_a", "aaaaaaaa%"])
+def test_find_by_prefix_not_found(storage: AnyTodoStorage, prefix: str) -> None:
+    """Test prefixes that match nothing, including SQL wildcards taken literally."""
+    _seed(storage)
+    assert storage.find_by_prefix(prefix) == []
+
+
+@pytest.mark.parametrize(
+    ("write_orjson", "read_orjson"), [(False, False), (True, False), (False, True)]
+)
+def test_roundtrip_with_and_without_orjson(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, write_orjson: bool, read_orjson: bool
+) -> None:
+    """Test files written with or without orjson read back the same either way."""
+    orjson = pytest.importorskip("orjson") if write_orjson or read_orjson else None
+    todos = [Todo(title="Café ☕", priority=Priority.HIGH, due_date="2024-06-01")]
+
+    monkeypatch.setattr(storage_module, "orjson", orjson if write_orjson else None)
+    TodoStorage(str(tmp_path / "todos.json")).save(todos)
+    assert json.loads((tmp_path / "todos.json").read_bytes()) == [todos[0].to_dict()]
+
+    monkeypatch.setattr(storage_module, "orjson", orjson if read_orjson else None)
+    assert TodoStorage(str(tmp_path / "todos.json")).load() == todos
+
+
+def test_unchanged_save_skips_write(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test saving identical contents doesn't rewrite the file."""
+    TodoStorage(str(tmp_path / "todos.json")).save([Todo(title="First")])
+    storage = TodoStorage(str(tmp_path / "todos.json"))
+
+    replaced: list[tuple[object, ...]] = []
+    monkeypatch.setattr(os, "replace", lambda *args: replaced.append(args))
+    storage.save(storage.load())
+
+    assert replaced == []
+    assert not (tmp_path / "todos.json.tmp").exists()
+
+
+def test_failed_save_keeps_data_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test a write that fails midway leaves the old file and no temp file."""
+    storage = TodoStorage(str(tmp_path / "todos.json"))
+    storage.save([Todo(title="First")])
+    before = (tmp_path / "todos.json").read_bytes()
+
+    def fail(fd: int) -> None:
+        raise OSError("disk full")
+
+    monkeypatch.setattr(os, "fsync", fail)
+    with pytest.raises(OSError, match="disk full"):
+        storage.save([Todo(title="Second")])
+
+    assert (tmp_path / "todos.json").read_bytes() == before
+    assert not (tmp_path / "todos.json.tmp").exists()
+
+
+def test_config_roundtrip(tmp_path: Path) -> None:
+    """Test config is written as JSON and read back unchanged."""
+    config = Config(default_priority=Priority.HIGH, show_completed=False)
+    ConfigStorage(str(tmp_path / "config.json")).save(config)
+
+    assert json.loads((tmp_path / "config.json").read_bytes()) == config.to_dict()
+    assert ConfigStorage(str(tmp_path / "config.json")).load() == config